@@ -40,8 +40,10 @@ class SaleOrderInherit(models.Model):
     
     @api.depends('order_line', 'priority')
     def _compute_custom_total(self):
+        # Warm the cache: one query for the lines of every record in self
+        self.mapped('order_line.price_total')
         for record in self:
-            base_total = sum(line.price_total for line in record.order_line)
+            base_total = sum(record.order_line.mapped('price_total'))
             if record.priority == 'high':
                 record.custom_total = base_total * 1.1  # 10% premium
             else:
@@ -56,18 +58,20 @@ class SaleOrderInherit(models.Model):
 
 ```python
 # Server Action Python Code
-for record in records:
-    if record.state == 'draft':
-        record.write({
-            'state': 'confirmed',
-            'confirmation_date': fields.Datetime.now()
-        })
-        
-        # Send notification
-        record.message_post(
-            body=f"Order {record.name} confirmed automatically",
-            subject="Auto Confirmation"
-        )
+draft_records = records.filtered(lambda r: r.state == 'draft')
+
+# One UPDATE for the whole batch instead of one per record
+draft_records.write({
+    'state': 'confirmed',
+    'confirmation_date': fields.Datetime.now()
+})
+
+# Send notification (message_post works on a single record)
+for record in draft_records:
+    record.message_post(
+        body=f"Order {record.name} confirmed automatically",
+        subject="Auto Confirmation"
+    )
 ```
 
 ### Advanced Server Action with Error Handling
@@ -76,37 +80,49 @@ for record in records:
 # Server Action with comprehensive logic
 try:
     processed_records = []
+    # Prefetch everything the loops touch in one batched read
+    records.read(['partner_id', 'user_id', 'amount_total', 'name', 'state', 'create_activity'])
+    
+    # Validation
     for record in records:
-        # Validation
         if not record.partner_id:
-            raise UserError(f"Partner is required for record {record.name}")
-        
-        # Business logic
-        if record.amount_total > 10000:
-            record.write({
-                'requires_approval': True,
-                'state': 'waiting_approval'
-            })
-        else:
-            record.write({
-                'state': 'confirmed',
-                'confirmed_by': env.user.id,
-                'confirmation_date': fields.Datetime.now()
-            })
-        
-        # Create related records
+            raise UserError("Partner is required for record %s" % record.name)
+    
+    # Business logic: one bulk write per target state
+    to_approve = records.filtered(lambda r: r.amount_total > 10000)
+    to_approve.write({
+        'requires_approval': True,
+        'state': 'waiting_approval'
+    })
+    (records - to_approve).write({
+        'state': 'confirmed',
+        'confirmed_by': env.user.id,
+        'confirmation_date': fields.Datetime.now()
+    })
+    
+    # Constant for the whole batch, resolve once
+    todo_type_id = env.ref('mail.mail_activity_data_todo').id
+    res_model_id = env['ir.model']._get(records._name).id
+    
+    activity_vals = []
+    for record in records:
+        # Collect related records
         if record.create_activity:
-            env['mail.activity'].create({
-                'activity_type_id': env.ref('mail.mail_activity_data_todo').id,
+            activity_vals.append({
+                'activity_type_id': todo_type_id,
                 'summary': f'Review {record.name}',
                 'note': 'Please review this record',
                 'user_id': record.user_id.id,
                 'res_id': record.id,
-                'res_model_id': env['ir.model']._get(record._name).id
+                'res_model_id': res_model_id
             })
         
         processed_records.append(record.name)
     
+    # Create all activities with one INSERT
+    if activity_vals:
+        env['mail.activity'].create(activity_vals)
+    
     # Return success message
     if processed_records:
         return {
@@ -139,32 +155,49 @@ except Exception as e:
 ### Scheduled Action Code
 
 ```python
+# Constant part of the domain, built once at import; only the date varies per run
+AUTO_PROCESS_BASE_DOMAIN = [
+    ('state', '=', 'draft'),
+    ('amount_total', '>', 0)
+]
+
 def auto_process_orders(self):
     """Automatically process orders that meet certain criteria"""
-    orders = self.env['sale.order'].search([
-        ('state', '=', 'draft'),
-        ('date_order', '<', fields.Datetime.now()),
-        ('amount_total', '>', 0)
-    ])
+    orders = self.env['sale.order'].search(
+        AUTO_PROCESS_BASE_DOMAIN + [('date_order', '<', fields.Datetime.now())]
+    )
     
-    processed_count = 0
-    for order in orders:
-        try:
-            # Add your business logic here
-            order.action_confirm()
-            
-            # Create invoice if needed
-            if order.auto_invoice:
-                invoice = order._create_invoices()
-                invoice.action_post()
-            
-            processed_count += 1
-            
-        except Exception as e:
-            # Log error but continue with other orders
-            _logger.error(f"Failed to process order {order.name}: {str(e)}")
+    # Fast path: confirm and invoice the whole batch in a few bulk calls.
+    # The ORM cursor cannot be shared between threads or coroutines, so
+    # batching (not concurrency) is what cuts the round trips here.
+    try:
+        with self.env.cr.savepoint():
+            orders.action_confirm()
+            to_invoice = orders.filtered('auto_invoice')
+            if to_invoice:
+                to_invoice._create_invoices().action_post()
+        processed_count = len(orders)
+    except Exception:
+        # Fall back to one order at a time to isolate the failing ones
+        processed_count = 0
+        for order in orders:
+            try:
+                with self.env.cr.savepoint():
+                    # Add your business logic here
+                    order.action_confirm()
+                    
+                    # Create invoice if needed
+                    if order.auto_invoice:
+                        invoice = order._create_invoices()
+                        invoice.action_post()
+                
+                processed_count += 1
+                
+            except Exception as e:
+                # Log error but continue with other orders
+                _logger.error("Failed to process order %s: %s", order.name, e)
     
-    _logger.info(f"Automatically processed {processed_count} orders")
+    _logger.info("Automatically processed %s orders", processed_count)
     return processed_count
 ```
 
@@ -179,48 +212,61 @@ class CustomModel(models.Model):
     
     def action_confirm(self):
         """Button action to confirm records"""
-        for record in self:
-            if record.state != 'draft':
-                continue
-                
-            record.write({
-                'state': 'confirmed',
-                'confirmed_by': self.env.uid,
-                'confirmation_date': fields.Datetime.now()
-            })
-            
-            # Trigger other actions
-            record._send_confirmation_email()
-            record._create_fulfillment_order()
+        to_confirm = self.filtered(lambda r: r.state == 'draft')
+        if not to_confirm:
+            return True
+        
+        # Single bulk write for all draft records
+        to_confirm.write({
+            'state': 'confirmed',
+            'confirmed_by': self.env.uid,
+            'confirmation_date': fields.Datetime.now()
+        })
+        
+        # Trigger other actions
+        to_confirm._send_confirmation_email()
+        to_confirm._create_fulfillment_order()
         
         return True
     
     def action_cancel(self):
         """Button action to cancel records"""
-        for record in self:
-            record.write({
-                'state': 'cancel',
-                'cancelled_by': self.env.uid,
-                'cancellation_date': fields.Datetime.now()
-            })
+        self.write({
+            'state': 'cancel',
+            'cancelled_by': self.env.uid,
+            'cancellation_date': fields.Datetime.now()
+        })
+    
+    @tools.ormcache()
+    def _confirmation_template_id(self):
+        """Resolve the template xmlid once; the id is cached per registry"""
+        return self.env.ref('your_module.email_template_confirmation').id
     
     def _send_confirmation_email(self):
-        """Private method to send confirmation email"""
-        template = self.env.ref('your_module.email_template_confirmation')
-        template.send_mail(self.id, force_send=True)
+        """Private method to send confirmation emails"""
+        template = self.env['mail.template'].browse(self._confirmation_template_id())
+        # Queue every mail first, then flush the batch in one send() call
+        # instead of one blocking SMTP exchange per record
+        mail_ids = [template.send_mail(record.id, force_send=False) for record in self]
+        self.env['mail.mail'].browse(mail_ids).send()
     
     def _create_fulfillment_order(self):
-        """Create related fulfillment records"""
-        fulfillment_vals = {
-            'source_id': self.id,
-            'partner_id': self.partner_id.id,
-            'date_planned': fields.Datetime.now(),
-            'lines': [(0, 0, {
-                'product_id': line.product_id.id,
-                'quantity': line.quantity,
-            }) for line in self.line_ids]
-        }
-        return self.env['fulfillment.order'].create(fulfillment_vals)
+        """Create related fulfillment records in a single batch create"""
+        now = fields.Datetime.now()
+        # One read for all lines; load=None returns raw ids (no name_get)
+        lines_by_parent = {}
+        for line in self.line_ids.read(['parent_id', 'product_id', 'quantity'], load=None):
+            lines_by_parent.setdefault(line['parent_id'], []).append((0, 0, {
+                'product_id': line['product_id'],
+                'quantity': line['quantity'],
+            }))
+        vals_list = [{
+            'source_id': record.id,
+            'partner_id': record.partner_id.id,
+            'date_planned': now,
+            'lines': lines_by_parent.get(record.id, [])
+        } for record in self]
+        return self.env['fulfillment.order'].create(vals_list)
 ```
 
 ## 5. Wizard and Transient Models
@@ -228,6 +274,9 @@ class CustomModel(models.Model):
 ### Interactive Wizard
 
 ```python
+from ast import literal_eval
+from odoo import _
+
 class BulkUpdateWizard(models.TransientModel):
     _name = 'bulk.update.wizard'
     _description = 'Bulk Update Wizard'
@@ -244,11 +293,17 @@ class BulkUpdateWizard(models.TransientModel):
         # Get the target model
         model = self.env[self.model_name]
         
-        # Parse domain
+        # Validate the field once, before touching any record
+        if self.field_name not in model._fields:
+            raise UserError(_("Field %s does not exist on %s") % (self.field_name, self.model_name))
+        
+        # Parse domain (literal_eval only accepts literals, never executes code)
         try:
-            domain = eval(self.domain) if self.domain else []
-        except:
-            domain = []
+            domain = literal_eval(self.domain) if self.domain else []
+        except (ValueError, SyntaxError, TypeError):
+            raise UserError(_("Invalid domain: %s") % self.domain)
+        if not isinstance(domain, list):
+            raise UserError(_("Invalid domain: %s") % self.domain)
         
         # Find records to update
         records = model.search(domain)
@@ -280,6 +335,8 @@ class BulkUpdateWizard(models.TransientModel):
 ### Data Migration Script
 
 ```python
+from psycopg2.extras import execute_values
+
 def migrate_customer_data(self):
     """Script to migrate customer data from old structure"""
     _logger.info("Starting customer data migration...")
@@ -290,46 +347,61 @@ def migrate_customer_data(self):
         ('x_legacy_id', '!=', False)  # Custom field for legacy ID
     ])
     
-    migration_count = 0
+    # Prefetch the fields read in the loop for all partners at once
+    partners.read(['x_legacy_code', 'x_old_category'])
+    
+    # Resolve all category mappings with one search before the loop
+    code_to_id = self._map_old_categories()
+    
+    # Collect the changes, then apply each kind with a single statement
+    ref_rows = []
+    category_rows = []
     for partner in partners:
-        try:
-            # Migrate contact information
-            migration_vals = {}
-            
-            if partner.x_legacy_code:
-                migration_vals['ref'] = partner.x_legacy_code
-            
-            if partner.x_old_category:
-                # Map old categories to new tags
-                new_category = self._map_old_category(partner.x_old_category)
-                if new_category:
-                    migration_vals['category_id'] = [(4, new_category.id)]
-            
-            if migration_vals:
-                partner.write(migration_vals)
-                migration_count += 1
-                
-        except Exception as e:
-            _logger.error(f"Failed to migrate partner {partner.id}: {str(e)}")
-            continue
+        # Migrate contact information
+        if partner.x_legacy_code:
+            ref_rows.append((partner.id, partner.x_legacy_code))
+        
+        # Map old categories to new tags
+        new_category_id = code_to_id.get(partner.x_old_category)
+        if new_category_id:
+            category_rows.append((partner.id, new_category_id))
     
-    _logger.info(f"Completed migration for {migration_count} partners")
+    # Plain SQL bypasses the ORM (no tracking/recompute on these two fields);
+    # flush pending writes first so they cannot overwrite the migrated values later
+    self.env['res.partner'].flush(['ref', 'category_id'])
+    if ref_rows:
+        execute_values(self.env.cr, """
+            UPDATE res_partner SET ref = data.ref
+            FROM (VALUES %s) AS data(id, ref)
+            WHERE res_partner.id = data.id
+        """, ref_rows)
+    if category_rows:
+        execute_values(self.env.cr, """
+            INSERT INTO res_partner_res_partner_category_rel (partner_id, category_id)
+            VALUES %s
+            ON CONFLICT DO NOTHING
+        """, category_rows)
+    
+    migrated_ids = {row[0] for row in ref_rows} | {row[0] for row in category_rows}
+    self.env['res.partner'].invalidate_cache(['ref', 'category_id'], list(migrated_ids))
+    migration_count = len(migrated_ids)
+    
+    _logger.info("Completed migration for %s partners", migration_count)
     return migration_count
 
-def _map_old_category(self, old_category):
-    """Map old category to new category ID"""
+def _map_old_categories(self):
+    """Map every old category code to its new category ID"""
     category_mapping = {
         'VIP': 'VIP Customer',
         'REGULAR': 'Regular Customer',
         'WHOLESALE': 'Wholesale Customer'
     }
     
-    new_category_name = category_mapping.get(old_category)
-    if new_category_name:
-        return self.env['res.partner.category'].search([
-            ('name', '=', new_category_name)
-        ], limit=1)
-    return False
+    categories = self.env['res.partner.category'].search([
+        ('name', 'in', list(category_mapping.values()))
+    ])
+    cats = {category.name: category.id for category in categories}
+    return {code: cats.get(name) for code, name in category_mapping.items()}
 ```
 
 ### Report Generation Script
@@ -337,6 +409,21 @@ def _map_old_category(self, old_category):
 ```python
 def generate_sales_report(self, start_date, end_date):
     """Generate custom sales report"""
+    # Aggregate counts and revenue per state in the database
+    summary_query = """
+        SELECT 
+            so.state,
+            COUNT(*) as order_count,
+            SUM(so.amount_total) as revenue
+        FROM sale_order so
+        JOIN res_partner rp ON so.partner_id = rp.id
+        JOIN res_users ru ON so.user_id = ru.id
+        WHERE so.date_order BETWEEN %s AND %s
+        GROUP BY so.state
+    """
+    self.env.cr.execute(summary_query, (start_date, end_date))
+    summary = self.env.cr.dictfetchall()
+    
     # Query sales data
     query = """
         SELECT 
@@ -350,7 +437,7 @@ def generate_sales_report(self, start_date, end_date):
         JOIN res_partner rp ON so.partner_id = rp.id
         JOIN res_users ru ON so.user_id = ru.id
         WHERE so.date_order BETWEEN %s AND %s
-        ORDER BY so.date_order DESC
+        ORDER BY so.id
     """
     
     self.env.cr.execute(query, (start_date, end_date))
@@ -360,18 +447,11 @@ def generate_sales_report(self, start_date, end_date):
     report_data = {
         'period': f"{start_date} to {end_date}",
         'total_orders': len(results),
-        'total_revenue': sum(r['amount_total'] for r in results),
-        'orders_by_state': {},
+        'total_revenue': sum(row['revenue'] or 0 for row in summary),
+        'orders_by_state': {row['state']: row['order_count'] for row in summary},
         'details': results
     }
     
-    # Group by state
-    for order in results:
-        state = order['state']
-        if state not in report_data['orders_by_state']:
-            report_data['orders_by_state'][state] = 0
-        report_data['orders_by_state'][state] += 1
-    
     return report_data
 ```
 
@@ -399,7 +479,35 @@ class CustomModel(models.Model):
         if not self.env.user.has_group('your_module.group_see_all'):
             args = expression.AND([args, [('user_id', '=', self.env.uid)]])
         
+        args = self._rewrite_empty_x2many(args)
         return super()._search(args, offset, limit, order, count, access_rights_uid)
+    
+    def _rewrite_empty_x2many(self, args):
+        """Turn ('x2many_field', '=', False) leaves into a correlated NOT EXISTS
+        sub-select instead of the default NOT IN (SELECT ...), which Postgres
+        materializes and rescans on large tables
+        
+        Only plain fields are rewritten: the raw sub-select would ignore the field's
+        domain, the comodel's active flag and its record rules, so those leaves keep
+        the ORM's version."""
+        result = []
+        for leaf in args:
+            field = expression.is_leaf(leaf) and self._fields.get(leaf[0])
+            if (field and leaf[1] == '=' and leaf[2] is False and field.type in ('one2many', 'many2many')
+                    and not field.domain and not self.env[field.comodel_name]._active_name
+                    and (self.env.su or not self.env['ir.rule']._compute_domain(field.comodel_name, 'read'))):
+                if field.type == 'one2many':
+                    sub_table = self.env[field.comodel_name]._table
+                    fk_column = field.inverse_name
+                else:
+                    sub_table = field.relation
+                    fk_column = field.column1
+                query = f'''SELECT t.id FROM "{self._table}" t WHERE NOT EXISTS (
+                    SELECT 1 FROM "{sub_table}" s WHERE s."{fk_column}" = t.id)'''
+                result.append(('id', 'inselect', (query, [])))
+            else:
+                result.append(leaf)
+        return result
 ```
 
 ## 8. Best Practices and Tips
@@ -407,20 +515,34 @@ class CustomModel(models.Model):
 ### Error Handling
 
 ```python
+RECORD_OPERATIONS = {
+    'confirm': lambda rs: rs.action_confirm(),
+    'cancel': lambda rs: rs.action_cancel(),
+    'archive': lambda rs: rs.write({'active': False}),
+}
+
 def safe_record_operation(self, records, operation):
     """Safely perform operations on records with proper error handling"""
     successful = []
     failed = []
+    op = RECORD_OPERATIONS.get(operation, lambda rs: None)
+    
+    # Fast path: one bulk call on the whole recordset
+    try:
+        with self.env.cr.savepoint():
+            op(records)
+        return {
+            'successful': records.mapped('name'),
+            'failed': failed
+        }
+    except Exception:
+        pass
     
+    # Slow path: only on error, retry per record to report which ones failed
     for record in records:
         try:
-            # Perform the operation
-            if operation == 'confirm':
-                record.action_confirm()
-            elif operation == 'cancel':
-                record.action_cancel()
-            elif operation == 'archive':
-                record.active = False
+            with self.env.cr.savepoint():
+                op(record)
             
             successful.append(record.name)
             
@@ -429,7 +551,7 @@ def safe_record_operation(self, records, operation):
                 'record': record.name,
                 'error': str(e)
             })
-            _logger.error(f"Operation failed for {record.name}: {str(e)}")
+            _logger.error("Operation failed for %s: %s", record.name, e)
     
     return {
         'successful': successful,
@@ -451,9 +573,15 @@ def optimized_bulk_operations(self):
     if records:
         records.write({'state': 'done'})
     
-    # Use read() for large datasets
-    large_dataset = self.search([('state', '=', 'done')])
-    data = large_dataset.read(['name', 'date', 'value'])
+    # Use search_read() for large datasets: one projected SELECT, no
+    # intermediate recordset
+    data = self.search_read([('state', '=', 'done')], ['name', 'date', 'value'])
+    
+    # Only one scalar column needed? mapped() gives a flat list, no per-row dicts:
+    # values = self.search([('state', '=', 'done')]).mapped('value')
+    
+    # Aggregates? let read_group sum in SQL instead of looping in Python:
+    # daily_totals = self.read_group([('state', '=', 'done')], ['value:sum'], ['date:day'])
     
     # Use SQL for complex operations
     query = """
@@ -461,5 +589,9 @@ def optimized_bulk_operations(self):
         SET state = 'processed' 
         WHERE state = 'draft' 
         AND date < %s
+        RETURNING id
     """
     self.env.cr.execute(query, (fields.Date.today(),))
+    processed_ids = [row[0] for row in self.env.cr.fetchall()]
+    # Invalidate the ORM cache for exactly the rows that changed
+    self.invalidate_cache(['state'], processed_ids)
@@ -6,13 +6,99 @@
 ### Basic Employee Model Extension
 
 ```python
-from odoo import models, fields, api
+from odoo import models, fields, api, sql_db
 from odoo.exceptions import UserError, ValidationError
+from odoo.addons.base.models.ir_mail_server import MailDeliveryException
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 import logging
+import psycopg2
+import smtplib
+import threading
+import time
 
 _logger = logging.getLogger(__name__)
 
+# How long a connection-test SMTP session may be reused before reconnecting
+TEST_SMTP_SESSION_TTL = 60.0
+
+# How long a successful connection test is reused for repeated clicks or polling
+CONNECTION_TEST_CACHE_TTL = 5.0
+
+# Share of the server's max_connections in use above which the connection test warns
+POOL_SATURATION_WARNING = 0.9
+
+# Connection probes run here so a wedged backend never blocks the request cursor
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='employee_app_probe')
+
+# Static parts of the connection test notifications, only the message varies per call
+_CONNECTION_TEST_SUCCESS = {'title': 'Connection Test Successful', 'type': 'success', 'sticky': False}
+_CONNECTION_TEST_FAILURE = {'title': 'Connection Test Failed', 'type': 'danger', 'sticky': True}
+_CONNECTION_TEST_WARNING = {'title': 'Database Connections Nearly Exhausted', 'type': 'warning', 'sticky': True}
+
+def _connection_test_notification(params, message):
+    """Build a display_notification action from one of the static templates"""
+    return {
+        'type': 'ir.actions.client',
+        'tag': 'display_notification',
+        'params': dict(params, message=message),
+    }
+
+def _format_probe_error(error):
+    """Short user-facing description of a probe failure, without formatting the traceback"""
+    return f'{type(error).__name__}: {error}' if str(error) else type(error).__name__
+
+def _probe_database(dbname):
+    """Return (client connections, max_connections) of the PostgreSQL server, probed on a
+    dedicated pooled connection with a short timeout"""
+    with sql_db.db_connect(dbname).cursor() as cr:
+        # Attribute-only check: a dead pooled connection fails here without a network round trip
+        cnx = cr._cnx
+        if cnx.closed or cnx.status != psycopg2.extensions.STATUS_READY:
+            raise psycopg2.OperationalError('Database connection is not ready')
+        cr.execute("SET LOCAL statement_timeout = '500ms'")
+        # Server-wide count against the server-wide limit: every Odoo worker, cron and
+        # longpolling process draws from max_connections, not from one process's db_maxconn
+        cr.execute("""
+            SELECT count(*), current_setting('max_connections')::int
+              FROM pg_stat_activity
+             WHERE backend_type = 'client backend'
+        """)
+        return cr.fetchone()
+
+def _next_sequence_codes(env, code, count):
+    """Reserve `count` numbers of an ir.sequence in a single round trip"""
+    if not count:
+        return []
+    # Same lookup as next_by_code: the current company's sequence first, then a shared one
+    sequence = env['ir.sequence'].sudo().search([
+        ('code', '=', code),
+        ('company_id', 'in', [env.company.id, False])
+    ], order='company_id', limit=1)
+    if not sequence:
+        return [False] * count
+    if sequence.use_date_range:
+        # Date-range sequences keep their counters per range, use the regular path
+        return [sequence.next_by_id() for _ in range(count)]
+    if sequence.implementation == 'standard':
+        # Backed by a PostgreSQL sequence: draw all values in one query
+        env.cr.execute(
+            "SELECT nextval(%s) FROM generate_series(1, %s)",
+            ('ir_sequence_%03d' % sequence.id, count)
+        )
+        numbers = [row[0] for row in env.cr.fetchall()]
+    else:
+        # No-gap sequence: bump the counter once for the whole block (one row lock)
+        env.cr.execute(
+            "UPDATE ir_sequence SET number_next = number_next + %s WHERE id = %s RETURNING number_next",
+            (count * sequence.number_increment, sequence.id)
+        )
+        next_free = env.cr.fetchone()[0]
+        first = next_free - count * sequence.number_increment
+        numbers = [first + i * sequence.number_increment for i in range(count)]
+        sequence.invalidate_cache(['number_next'])
+    return [sequence.get_next_char(number) for number in numbers]
+
 class CustomEmployee(models.Model):
     _name = 'custom.employee'
     _description = 'Custom Employee Management'
@@ -36,9 +122,13 @@ class CustomEmployee(models.Model):
         ('probation', 'Probation')
     ], string='Employment Type', default='full_time', tracking=True)
     
-    probation_end_date = fields.Date(string='Probation End Date')
+    probation_end_date = fields.Date(string='Probation End Date', index=True)
     notice_period = fields.Integer(string='Notice Period (Days)', default=30)
-    retirement_date = fields.Date(string='Planned Retirement Date', compute='_compute_retirement_date', store=True)
+    retirement_date = fields.Date(string='Planned Retirement Date', compute='_compute_retirement_date')
+    
+    # Month/day keys (MMDD) so the daily crons can do an indexed equality lookup
+    birthday_month_day = fields.Integer(compute='_compute_birthday_month_day', store=True, index=True)
+    anniversary_month_day = fields.Integer(compute='_compute_anniversary_month_day', store=True, index=True)
     
     # Skills and Qualifications
     skills_ids = fields.Many2many('employee.skill', string='Skills')
@@ -59,11 +149,24 @@ class CustomEmployee(models.Model):
             else:
                 employee.retirement_date = False
     
+    @api.depends('birthday')
+    def _compute_birthday_month_day(self):
+        for employee in self:
+            birthday = employee.birthday
+            employee.birthday_month_day = birthday.month * 100 + birthday.day if birthday else 0
+    
+    @api.depends('create_date')
+    def _compute_anniversary_month_day(self):
+        for employee in self:
+            create_date = employee.create_date
+            employee.anniversary_month_day = create_date.month * 100 + create_date.day if create_date else 0
+    
     # Constraints
     @api.constrains('probation_end_date')
     def _check_probation_end_date(self):
+        today = fields.Date.today()
         for employee in self:
-            if employee.probation_end_date and employee.probation_end_date < fields.Date.today():
+            if employee.probation_end_date and employee.probation_end_date < today:
                 raise ValidationError("Probation end date cannot be in the past!")
     
     # Sequence Generation
@@ -73,40 +176,49 @@ class CustomEmployee(models.Model):
         return sequence
     
     # Override Create Method
-    @api.model
-    def create(self, vals):
-        if vals.get('employee_code', 'New') == 'New':
-            vals['employee_code'] = self.env['ir.sequence'].next_by_code('custom.employee.code') or 'New'
-        
-        # Set work email if not provided
-        if not vals.get('work_email') and vals.get('personal_email'):
-            vals['work_email'] = vals['personal_email']
-        
-        employee = super().create(vals)
-        
-        # Create welcome activity
-        employee.activity_schedule(
-            'mail.mail_activity_data_todo',
-            summary=f'Welcome {employee.name}',
-            note=f'New employee onboarding process started for {employee.name}',
-            user_id=employee.parent_id.user_id.id if employee.parent_id else self.env.user.id
-        )
+    @api.model_create_multi
+    def create(self, vals_list):
+        # Allocate all new employee codes in one sequence round trip
+        pending = [vals for vals in vals_list if vals.get('employee_code', 'New') == 'New']
+        codes = _next_sequence_codes(self.env, 'custom.employee.code', len(pending))
+        for vals, code in zip(pending, codes):
+            vals['employee_code'] = code or 'New'
+        
+        for vals in vals_list:
+            # Set work email if not provided
+            if not vals.get('work_email') and vals.get('personal_email'):
+                vals['work_email'] = vals['personal_email']
+        
+        employees = super().create(vals_list)
         
-        return employee
+        # Create all welcome activities in one batch
+        todo_type_id = self.env.ref('mail.mail_activity_data_todo').id
+        res_model_id = self.env['ir.model']._get(self._name).id
+        self.env['mail.activity'].create([{
+            'activity_type_id': todo_type_id,
+            'res_model_id': res_model_id,
+            'res_id': employee.id,
+            'summary': f'Welcome {employee.name}',
+            'note': f'New employee onboarding process started for {employee.name}',
+            'user_id': employee.parent_id.user_id.id if employee.parent_id else self.env.user.id
+        } for employee in employees])
+        
+        return employees
     
     # Action Methods
     def action_send_welcome_email(self):
-        """Send welcome email to new employee"""
-        self.ensure_one()
+        """Send welcome email to new employees"""
+        # Resolve the template once, then queue one mail per employee
         template = self.env.ref('employee_app.email_template_employee_welcome')
-        template.send_mail(self.id, force_send=False)
+        for employee in self:
+            template.send_mail(employee.id, force_send=False)
         
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
             'params': {
                 'title': 'Welcome Email Sent',
-                'message': f'Welcome email sent to {self.name}',
+                'message': f'Welcome email sent to {", ".join(self.mapped("name"))}',
                 'type': 'success',
                 'sticky': False,
             }
@@ -199,7 +311,7 @@ class EmployeeEquipment(models.Model):
     model = fields.Char(string='Model')
     serial_number = fields.Char(string='Serial Number')
     purchase_date = fields.Date(string='Purchase Date')
-    warranty_end_date = fields.Date(string='Warranty End Date')
+    warranty_end_date = fields.Date(string='Warranty End Date', index=True)
     purchase_cost = fields.Float(string='Purchase Cost')
     
     # Assignment Details
@@ -218,36 +330,51 @@ class EmployeeEquipment(models.Model):
     
     condition_notes = fields.Text(string='Condition Notes')
     
-    @api.model
-    def create(self, vals):
-        if vals.get('equipment_code', 'New') == 'New':
-            vals['equipment_code'] = self.env['ir.sequence'].next_by_code('employee.equipment.code') or 'New'
-        return super().create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        # Allocate all new asset codes in one sequence round trip
+        pending = [vals for vals in vals_list if vals.get('equipment_code', 'New') == 'New']
+        codes = _next_sequence_codes(self.env, 'employee.equipment.code', len(pending))
+        for vals, code in zip(pending, codes):
+            vals['equipment_code'] = code or 'New'
+        return super().create(vals_list)
     
     def action_return_equipment(self):
         """Mark equipment as returned"""
-        for equipment in self:
-            equipment.write({
-                'state': 'returned',
-                'actual_return_date': fields.Date.today()
-            })
-            
-            # Notify IT department
-            equipment.message_post(
-                body=f"Equipment {equipment.name} returned by {equipment.employee_id.name}",
-                subject="Equipment Returned"
-            )
+        # One UPDATE for all returned equipment
+        self.write({
+            'state': 'returned',
+            'actual_return_date': fields.Date.today()
+        })
+        
+        # Notify IT department: one batched log note instead of a message_post per record
+        self.mapped('employee_id')
+        self._message_log_batch(
+            bodies={
+                equipment.id: f"Equipment {equipment.name} returned by {equipment.employee_id.name}"
+                for equipment in self
+            },
+            subject="Equipment Returned"
+        )
     
     def action_send_maintenance_alert(self):
         """Send maintenance alert for equipment"""
-        for equipment in self:
-            if equipment.warranty_end_date and equipment.warranty_end_date < fields.Date.today():
-                equipment.activity_schedule(
-                    'mail.mail_activity_data_todo',
-                    summary='Equipment Maintenance Required',
-                    note=f'Equipment {equipment.name} warranty has expired. Schedule maintenance.',
-                    user_id=self.env.user.id
-                )
+        expired = self.filtered_domain([
+            ('warranty_end_date', '!=', False),
+            ('warranty_end_date', '<', fields.Date.today())
+        ])
+        if not expired:
+            return
+        todo_type_id = self.env.ref('mail.mail_activity_data_todo').id
+        res_model_id = self.env['ir.model']._get(self._name).id
+        self.env['mail.activity'].create([{
+            'activity_type_id': todo_type_id,
+            'res_model_id': res_model_id,
+            'res_id': equipment.id,
+            'summary': 'Equipment Maintenance Required',
+            'note': f'Equipment {equipment.name} warranty has expired. Schedule maintenance.',
+            'user_id': self.env.user.id
+        } for equipment in expired])
 ```
 
 ## 4. Server Actions for Employee Management
@@ -261,37 +388,43 @@ def employee_onboarding_process(records):
     Automated onboarding process for new employees
     """
     try:
-        for employee in records:
-            # Create equipment assignment request
-            equipment_vals = {
-                'employee_id': employee.id,
-                'name': 'Standard Laptop Setup',
-                'category': 'laptop',
-                'assignment_date': fields.Date.today(),
-                'state': 'assigned'
-            }
-            env['employee.equipment'].create(equipment_vals)
-            
-            # Create onboarding checklist
-            checklist_items = [
-                'HR Documentation',
-                'System Access Setup',
-                'Email Configuration',
-                'Security Training',
-                'Team Introduction'
-            ]
-            
-            for item in checklist_items:
-                employee.activity_schedule(
-                    'mail.mail_activity_data_todo',
-                    summary=f'Onboarding: {item}',
-                    note=f'Complete {item} for {employee.name}',
-                    user_id=employee.department_id.manager_id.user_id.id if employee.department_id.manager_id else env.user.id
-                )
-            
-            # Send welcome package notification
-            employee.message_post(
-                body=f"""
+        # Prefetch the manager chains used in the loop in a few batched queries
+        records.mapped('parent_id.user_id')
+        records.mapped('department_id.manager_id.user_id')
+        
+        today = fields.Date.today()
+        
+        # Create equipment assignment requests for all employees in one create()
+        env['employee.equipment'].create([{
+            'employee_id': employee.id,
+            'name': 'Standard Laptop Setup',
+            'category': 'laptop',
+            'assignment_date': today,
+            'state': 'assigned'
+        } for employee in records])
+        
+        # Create onboarding checklist: every activity for every employee in one create()
+        checklist_items = [
+            'HR Documentation',
+            'System Access Setup',
+            'Email Configuration',
+            'Security Training',
+            'Team Introduction'
+        ]
+        todo_type_id = env.ref('mail.mail_activity_data_todo').id
+        res_model_id = env['ir.model']._get('custom.employee').id
+        env['mail.activity'].create([{
+            'activity_type_id': todo_type_id,
+            'res_model_id': res_model_id,
+            'res_id': employee.id,
+            'summary': f'Onboarding: {item}',
+            'note': f'Complete {item} for {employee.name}',
+            'user_id': employee.department_id.manager_id.user_id.id if employee.department_id.manager_id else env.user.id
+        } for employee in records for item in checklist_items])
+        
+        # Send welcome package notifications as one batch of log notes
+        records._message_log_batch(
+            bodies={employee.id: f"""
                 <p>Welcome to the team, {employee.name}!</p>
                 <p>Your onboarding process has been initiated.</p>
                 <p><strong>Next Steps:</strong></p>
@@ -301,9 +434,9 @@ def employee_onboarding_process(records):
                     <li>Meet with your manager</li>
                     <li>Set up your workstation</li>
                 </ul>
-                """,
-                subject=f"Welcome to the Company - {employee.name}"
-            )
+                """ for employee in records},
+            subject="Welcome to the Company"
+        )
         
         return {
             'type': 'ir.actions.client',
@@ -339,7 +472,6 @@ def bulk_equipment_assignment(records):
     """
     try:
         Equipment = env['employee.equipment']
-        assigned_count = 0
         
         standard_equipment = [
             {'name': 'Dell Laptop', 'category': 'laptop'},
@@ -348,23 +480,23 @@ def bulk_equipment_assignment(records):
             {'name': 'Company Mobile', 'category': 'mobile'}
         ]
         
-        for employee in records:
-            for item in standard_equipment:
-                equipment_vals = {
-                    'employee_id': employee.id,
-                    'name': item['name'],
-                    'category': item['category'],
-                    'assignment_date': fields.Date.today(),
-                    'state': 'assigned'
-                }
-                Equipment.create(equipment_vals)
-                assigned_count += 1
-            
-            # Notify employee
-            employee.message_post(
-                body="Standard equipment package has been assigned to you.",
-                subject="Equipment Assignment"
-            )
+        # Build every assignment first, then insert them all in one create()
+        today = fields.Date.today()
+        all_vals = [{
+            'employee_id': employee.id,
+            'name': item['name'],
+            'category': item['category'],
+            'assignment_date': today,
+            'state': 'assigned'
+        } for employee in records for item in standard_equipment]
+        Equipment.create(all_vals)
+        assigned_count = len(all_vals)
+        
+        # Notify employees with one batch of log notes
+        records._message_log_batch(
+            bodies=dict.fromkeys(records.ids, "Standard equipment package has been assigned to you."),
+            subject="Equipment Assignment"
+        )
         
         return {
             'type': 'ir.actions.client',
@@ -399,91 +531,107 @@ class EmployeeAutomatedTasks(models.Model):
     _name = 'employee.automated.tasks'
     _description = 'Automated Employee Management Tasks'
     
+    def _create_activities(self, vals_list):
+        """Create activities in one batch, falling back to one at a time on error"""
+        try:
+            with self.env.cr.savepoint():
+                self.env['mail.activity'].create(vals_list)
+            return len(vals_list)
+        except Exception:
+            _logger.exception("Batched activity creation failed, retrying one by one")
+        
+        created = 0
+        for vals in vals_list:
+            try:
+                with self.env.cr.savepoint():
+                    self.env['mail.activity'].create(vals)
+                created += 1
+            except Exception:
+                _logger.exception("Could not create activity for record %s", vals['res_id'])
+        return created
+    
     def auto_probation_review(self):
         """
         Scheduled Action: Automatically check for probation endings
         Runs daily to identify employees whose probation ends in 7 days
         """
-        try:
-            review_date = fields.Date.today() + timedelta(days=7)
-            
-            # Find employees with probation ending in 7 days
-            probation_employees = self.env['custom.employee'].search([
-                ('probation_end_date', '=', review_date),
-                ('employment_type', '=', 'probation')
-            ])
-            
-            review_count = 0
-            for employee in probation_employees:
-                # Create probation review activity for manager
-                if employee.parent_id:
-                    employee.activity_schedule(
-                        'mail.mail_activity_data_todo',
-                        review_date,
-                        summary=f'Probation Review: {employee.name}',
-                        note=f'Probation period ends on {employee.probation_end_date}. Schedule review meeting.',
-                        user_id=employee.parent_id.user_id.id
-                    )
-                    review_count += 1
-            
-            _logger.info(f"Scheduled {review_count} probation reviews")
-            return review_count
-            
-        except Exception as e:
-            _logger.error(f"Probation review scheduling failed: {str(e)}")
-            return 0
+        review_date = fields.Date.today() + timedelta(days=7)
+        
+        # Find employees with probation ending in 7 days
+        probation_employees = self.env['custom.employee'].search([
+            ('probation_end_date', '=', review_date),
+            ('employment_type', '=', 'probation')
+        ])
+        
+        # Prefetch managers' users for the whole batch
+        probation_employees.mapped('parent_id.user_id')
+        
+        # Create probation review activities for managers in one batch
+        todo_type_id = self.env.ref('mail.mail_activity_data_todo').id
+        res_model_id = self.env['ir.model']._get('custom.employee').id
+        review_count = self._create_activities([{
+            'activity_type_id': todo_type_id,
+            'res_model_id': res_model_id,
+            'res_id': employee.id,
+            'date_deadline': review_date,
+            'summary': f'Probation Review: {employee.name}',
+            'note': f'Probation period ends on {employee.probation_end_date}. Schedule review meeting.',
+            'user_id': employee.parent_id.user_id.id
+        } for employee in probation_employees if employee.parent_id])
+        
+        _logger.info(f"Scheduled {review_count} probation reviews")
+        return review_count
     
     def auto_equipment_maintenance_check(self):
         """
         Scheduled Action: Check equipment warranty and maintenance
         Runs weekly to identify equipment needing maintenance
         """
-        try:
-            today = fields.Date.today()
-            next_month = today + timedelta(days=30)
-            
-            # Find equipment with warranty ending in next 30 days
-            expiring_equipment = self.env['employee.equipment'].search([
-                ('warranty_end_date', '>=', today),
-                ('warranty_end_date', '<=', next_month),
-                ('state', '=', 'assigned')
-            ])
-            
-            maintenance_count = 0
-            for equipment in expiring_equipment:
-                # Create maintenance alert
-                equipment.activity_schedule(
-                    'mail.mail_activity_data_todo',
-                    equipment.warranty_end_date,
-                    summary=f'Equipment Maintenance: {equipment.name}',
-                    note=f'Warranty for {equipment.name} expires on {equipment.warranty_end_date}. Schedule maintenance.',
-                    user_id=self.env.user.id
-                )
-                maintenance_count += 1
-            
-            _logger.info(f"Scheduled {maintenance_count} equipment maintenance alerts")
-            return maintenance_count
-            
-        except Exception as e:
-            _logger.error(f"Equipment maintenance check failed: {str(e)}")
-            return 0
+        today = fields.Date.today()
+        next_month = today + timedelta(days=30)
+        
+        # Find equipment with warranty ending in next 30 days
+        expiring_equipment = self.env['employee.equipment'].search([
+            ('warranty_end_date', '>=', today),
+            ('warranty_end_date', '<=', next_month),
+            ('state', '=', 'assigned')
+        ])
+        
+        # Create maintenance alerts in one batch
+        todo_type_id = self.env.ref('mail.mail_activity_data_todo').id
+        res_model_id = self.env['ir.model']._get('employee.equipment').id
+        maintenance_count = self._create_activities([{
+            'activity_type_id': todo_type_id,
+            'res_model_id': res_model_id,
+            'res_id': equipment.id,
+            'date_deadline': equipment.warranty_end_date,
+            'summary': f'Equipment Maintenance: {equipment.name}',
+            'note': f'Warranty for {equipment.name} expires on {equipment.warranty_end_date}. Schedule maintenance.',
+            'user_id': self.env.user.id
+        } for equipment in expiring_equipment])
+        
+        _logger.info(f"Scheduled {maintenance_count} equipment maintenance alerts")
+        return maintenance_count
     
     def auto_birthday_announcements(self):
         """
         Scheduled Action: Send birthday announcements
         Runs daily to celebrate employee birthdays
         """
-        try:
-            today = fields.Date.today()
-            
-            # Find employees with birthday today
-            birthday_employees = self.env['custom.employee'].search([
-                ('birthday', '!=', False)
-            ])
-            
-            birthday_celebrations = 0
-            for employee in birthday_employees:
-                if employee.birthday.month == today.month and employee.birthday.day == today.day:
+        today = fields.Date.today()
+        
+        # Find employees with birthday today (indexed equality lookup)
+        birthday_employees = self.env['custom.employee'].search([
+            ('birthday_month_day', '=', today.month * 100 + today.day)
+        ])
+        
+        # Resolve the company-wide channel once
+        birthday_channel = self.env.ref('employee_app.channel_birthdays', False)
+        
+        celebrated_ids = []
+        for employee in birthday_employees:
+            try:
+                with self.env.cr.savepoint():
                     # Post birthday message to employee's chatter
                     employee.message_post(
                         body=f"🎉 Happy Birthday, {employee.name}! 🎂",
@@ -491,59 +639,58 @@ class EmployeeAutomatedTasks(models.Model):
                         message_type='comment',
                         subtype_xmlid='mail.mt_comment'
                     )
-                    
-                    # Send to company-wide channel if configured
-                    birthday_channel = self.env.ref('employee_app.channel_birthdays', False)
-                    if birthday_channel:
-                        birthday_channel.message_post(
-                            body=f"🎉 Let's wish {employee.name} a Happy Birthday today! 🎂",
-                            subject="Birthday Celebration",
-                            message_type='comment'
-                        )
-                    
-                    birthday_celebrations += 1
-            
-            _logger.info(f"Celebrated {birthday_celebrations} birthdays")
-            return birthday_celebrations
-            
-        except Exception as e:
-            _logger.error(f"Birthday announcements failed: {str(e)}")
-            return 0
+                
+                celebrated_ids.append(employee.id)
+            except Exception:
+                _logger.exception("Birthday announcement failed for employee %s", employee.id)
+        
+        celebrated = birthday_employees.browse(celebrated_ids)
+        
+        # One aggregated post to the company-wide channel, if configured
+        if birthday_channel and celebrated:
+            names = ", ".join(celebrated.mapped('name'))
+            birthday_channel.message_post(
+                body=f"🎉 Let's wish {names} a Happy Birthday today! 🎂",
+                subject="Birthday Celebration",
+                message_type='comment'
+            )
+        
+        birthday_celebrations = len(celebrated)
+        _logger.info(f"Celebrated {birthday_celebrations} birthdays")
+        return birthday_celebrations
     
     def auto_work_anniversary_celebrations(self):
         """
         Scheduled Action: Celebrate work anniversaries
         Runs daily to recognize employee work anniversaries
         """
-        try:
-            today = fields.Date.today()
-            
-            # Find employees with work anniversary today
-            anniversary_employees = self.env['custom.employee'].search([
-                ('create_date', '!=', False)
-            ])
+        today = fields.Date.today()
+        
+        # Find employees with work anniversary today (indexed equality lookup)
+        anniversary_employees = self.env['custom.employee'].search([
+            ('anniversary_month_day', '=', today.month * 100 + today.day)
+        ])
+        
+        anniversary_count = 0
+        for employee in anniversary_employees:
+            # create_date is already a datetime, no string parsing needed
+            years_with_company = today.year - employee.create_date.year
             
-            anniversary_count = 0
-            for employee in anniversary_employees:
-                create_date = fields.Date.from_string(employee.create_date)
-                if create_date.month == today.month and create_date.day == today.day:
-                    years_with_company = today.year - create_date.year
-                    
+            try:
+                with self.env.cr.savepoint():
                     # Post anniversary message
                     employee.message_post(
                         body=f"🎊 Congratulations {employee.name} on {years_with_company} year{'s' if years_with_company > 1 else ''} with the company! 🎊",
                         subject="Work Anniversary",
                         message_type='comment'
                     )
-                    
-                    anniversary_count += 1
-            
-            _logger.info(f"Celebrated {anniversary_count} work anniversaries")
-            return anniversary_count
-            
-        except Exception as e:
-            _logger.error(f"Work anniversary celebrations failed: {str(e)}")
-            return 0
+                
+                anniversary_count += 1
+            except Exception:
+                _logger.exception("Work anniversary message failed for employee %s", employee.id)
+        
+        _logger.info(f"Celebrated {anniversary_count} work anniversaries")
+        return anniversary_count
 ```
 
 ## 6. Employee Performance and Reviews
@@ -599,14 +746,9 @@ class EmployeeReview(models.Model):
     
     @api.depends('technical_skills', 'communication_skills', 'teamwork')
     def _compute_overall_rating(self):
+        rating_fields = ['technical_skills', 'communication_skills', 'teamwork']
         for review in self:
-            ratings = []
-            if review.technical_skills:
-                ratings.append(int(review.technical_skills))
-            if review.communication_skills:
-                ratings.append(int(review.communication_skills))
-            if review.teamwork:
-                ratings.append(int(review.teamwork))
+            ratings = [int(review[name]) for name in rating_fields if review[name]]
             
             if ratings:
                 review.overall_rating = sum(ratings) / len(ratings)
@@ -625,12 +767,13 @@ class EmployeeReview(models.Model):
     
     def action_complete_review(self):
         """Complete the review"""
+        follow_up_date = fields.Date.today() + timedelta(days=30)
         for review in self:
             review.state = 'completed'
             # Schedule follow-up meeting
             review.activity_schedule(
                 'mail.mail_activity_data_meeting',
-                fields.Date.today() + timedelta(days=30),
+                follow_up_date,
                 summary='Follow-up: Performance Review',
                 note=f'Follow-up discussion for performance review with {review.employee_id.name}',
                 user_id=review.reviewer_id.user_id.id
@@ -646,10 +789,10 @@ class EmployeeDashboard(models.Model):
     
     def get_employee_statistics(self):
         """Get comprehensive employee statistics"""
-        employees = self.env['custom.employee'].search([])
+        Employee = self.env['custom.employee']
         
         stats = {
-            'total_employees': len(employees),
+            'total_employees': Employee.search_count([]),
             'by_department': {},
             'by_employment_type': {},
             'by_location': {},
@@ -657,34 +800,38 @@ class EmployeeDashboard(models.Model):
             'upcoming_probations': []
         }
         
-        # Department breakdown
+        # Department breakdown (GROUP BY in SQL, departments without employees show 0)
         departments = self.env['hr.department'].search([])
-        for dept in departments:
-            dept_employees = employees.filtered(lambda e: e.department_id == dept)
-            stats['by_department'][dept.name] = len(dept_employees)
+        stats['by_department'] = {dept.name: 0 for dept in departments}
+        # read_group labels are complete_name ("Parent / Child"), so map back by id
+        dept_names = {dept.id: dept.name for dept in departments}
+        for group in Employee.read_group([('department_id', '!=', False)], ['department_id'], ['department_id']):
+            dept_id, dept_label = group['department_id']
+            stats['by_department'][dept_names.get(dept_id, dept_label)] = group['department_id_count']
         
         # Employment type breakdown
-        employment_types = set(employees.mapped('employment_type'))
-        for emp_type in employment_types:
-            type_employees = employees.filtered(lambda e: e.employment_type == emp_type)
-            stats['by_employment_type'][emp_type] = len(type_employees)
+        for group in Employee.read_group([], ['employment_type'], ['employment_type']):
+            stats['by_employment_type'][group['employment_type']] = group['employment_type_count']
+        
+        today = fields.Date.today()
         
         # Recent joiners (last 30 days)
-        thirty_days_ago = fields.Date.today() - timedelta(days=30)
-        recent_joiners = employees.filtered(
-            lambda e: e.create_date and fields.Date.from_string(e.create_date) >= thirty_days_ago
-        )
+        thirty_days_ago = today - timedelta(days=30)
+        recent_joiners = Employee.search([
+            ('create_date', '>=', thirty_days_ago)
+        ], order='create_date desc', limit=5)  # Limit to 5 most recent
         stats['recent_joiners'] = [{
             'name': emp.name,
             'department': emp.department_id.name if emp.department_id else 'N/A',
             'join_date': emp.create_date
-        } for emp in recent_joiners[:5]]  # Limit to 5 most recent
+        } for emp in recent_joiners]
         
         # Upcoming probation endings
-        next_week = fields.Date.today() + timedelta(days=7)
-        upcoming_probations = employees.filtered(
-            lambda e: e.probation_end_date and e.probation_end_date <= next_week
-        )
+        next_week = today + timedelta(days=7)
+        upcoming_probations = Employee.search([
+            ('probation_end_date', '!=', False),
+            ('probation_end_date', '<=', next_week)
+        ])
         stats['upcoming_probations'] = [{
             'name': emp.name,
             'probation_end_date': emp.probation_end_date,
@@ -695,32 +842,29 @@ class EmployeeDashboard(models.Model):
     
     def get_equipment_report(self):
         """Generate equipment assignment report"""
-        equipment = self.env['employee.equipment'].search([])
+        Equipment = self.env['employee.equipment']
         
         report = {
-            'total_equipment': len(equipment),
+            'total_equipment': Equipment.search_count([]),
             'by_category': {},
             'by_status': {},
             'warranty_expiring': []
         }
         
         # Category breakdown
-        categories = set(equipment.mapped('category'))
-        for category in categories:
-            category_equipment = equipment.filtered(lambda e: e.category == category)
-            report['by_category'][category] = len(category_equipment)
+        for group in Equipment.read_group([], ['category'], ['category']):
+            report['by_category'][group['category']] = group['category_count']
         
         # Status breakdown
-        statuses = set(equipment.mapped('state'))
-        for status in statuses:
-            status_equipment = equipment.filtered(lambda e: e.state == status)
-            report['by_status'][status] = len(status_equipment)
+        for group in Equipment.read_group([], ['state'], ['state']):
+            report['by_status'][group['state']] = group['state_count']
         
         # Warranty expiring in next 30 days
         next_month = fields.Date.today() + timedelta(days=30)
-        expiring_equipment = equipment.filtered(
-            lambda e: e.warranty_end_date and e.warranty_end_date <= next_month
-        )
+        expiring_equipment = Equipment.search([
+            ('warranty_end_date', '!=', False),
+            ('warranty_end_date', '<=', next_month)
+        ])
         report['warranty_expiring'] = [{
             'name': eq.name,
             'assigned_to': eq.employee_id.name,
@@ -742,13 +886,16 @@ class EmployeeSecurity(models.Model):
         if self.has_group('hr.group_hr_manager'):
             return True
         
+        # [:1] keeps the caller's prefetch set, so checking users in a loop
+        # resolves employee/department/manager for all of them in one query each
+        employee = self.employee_ids[:1]
+        
         # Employees can read their own data
-        if operation == 'read' and self.employee_ids:
+        if operation == 'read' and employee:
             return True
         
         # Department managers can manage their department
-        if self.employee_ids and self.employee_ids[0].department_id and \
-           self.employee_ids[0].department_id.manager_id == self.employee_ids[0]:
+        if employee and employee.department_id.manager_id == employee:
             return True
         
         return False
@@ -784,39 +931,109 @@ class EmployeeAppConfiguration(models.Model):
     email_notifications = fields.Boolean(string='Email Notifications', default=True)
     push_notifications = fields.Boolean(string='Push Notifications', default=False)
     
+    # SMTP sessions reused across connection tests: dbname -> (opened_at, session)
+    _test_smtp_sessions = {}
+    # One lock per database serializes use of its session; the global lock only guards the dict
+    _test_smtp_locks = {}
+    _test_smtp_lock = threading.Lock()
+    
+    # Last successful connection test: (dbname, uid) -> finished_at
+    _probe_cache = {}
+    _probe_cache_lock = threading.Lock()
+    
+    def _get_test_smtp_session(self):
+        """Return an open SMTP session, reusing the cached one while it is fresh"""
+        now = time.monotonic()
+        opened_at, session = self._test_smtp_sessions.get(self.env.cr.dbname, (0.0, None))
+        if session is not None and now - opened_at < TEST_SMTP_SESSION_TTL:
+            return session
+        self._drop_test_smtp_session()
+        session = self.env['ir.mail_server'].connect()
+        self._test_smtp_sessions[self.env.cr.dbname] = (now, session)
+        return session
+    
+    def _get_test_smtp_lock(self):
+        """Return the lock guarding this database's cached SMTP session"""
+        with self._test_smtp_lock:
+            return self._test_smtp_locks.setdefault(self.env.cr.dbname, threading.Lock())
+    
+    def _drop_test_smtp_session(self):
+        """Close and forget the cached SMTP session of this database"""
+        opened_at, session = self._test_smtp_sessions.pop(self.env.cr.dbname, (0.0, None))
+        if session is not None:
+            try:
+                session.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+    
+    def _probe_mail(self, email_to):
+        """Send a test email over a reused SMTP session"""
+        # Reusing the session skips the TLS/auth handshake of a fresh connection on every click
+        IrMailServer = self.env['ir.mail_server']
+        message = IrMailServer.build_email(
+            email_from=False,
+            email_to=[email_to],
+            subject='Employee App Test',
+            body='<p>This is a test email from your Employee App.</p>',
+            subtype='html'
+        )
+        with self._get_test_smtp_lock():
+            try:
+                IrMailServer.send_email(message, smtp_session=self._get_test_smtp_session())
+            except (MailDeliveryException, smtplib.SMTPException):
+                # Stale or broken session: drop it and retry once on a fresh connection
+                self._drop_test_smtp_session()
+                IrMailServer.send_email(message, smtp_session=self._get_test_smtp_session())
+    
     def test_online_connection(self):
         """Test connection to Odoo Online services"""
+        cache_key = (self.env.cr.dbname, self.env.uid)
+        with self._probe_cache_lock:
+            finished_at = self._probe_cache.get(cache_key)
+        if finished_at is not None and time.monotonic() - finished_at < CONNECTION_TEST_CACHE_TTL:
+            return _connection_test_notification(_CONNECTION_TEST_SUCCESS, 'All services are working properly')
+        
+        # Without a recipient the mail probe can only fail with an obscure SMTP error
+        user_email = self.env.user.email_formatted
+        if not user_email:
+            return _connection_test_notification(_CONNECTION_TEST_FAILURE, 'Error: your user has no email address configured')
+        
+        # The database probe runs on its own connection in the background while
+        # the mail probe, which needs this request's cursor, runs here
+        db_future = _PROBE_EXECUTOR.submit(_probe_database, self.env.cr.dbname)
+        
+        errors = []
+        warning = None
         try:
-            # Test database connection
-            self.env.cr.execute("SELECT 1")
-            
-            # Test email configuration
-            self.env['mail.mail'].create({
-                'email_to': self.env.user.email,
-                'subject': 'Employee App Test',
-                'body_html': '<p>This is a test email from your Employee App.</p>'
-            }).send()
-            
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': 'Connection Test Successful',
-                    'message': 'All services are working properly',
-                    'type': 'success',
-                    'sticky': False,
-                }
-            }
+            self._probe_mail(user_email)
+        except (MailDeliveryException, smtplib.SMTPException, OSError, UserError) as e:
+            errors.append(f'Email: {_format_probe_error(e)}')
         except Exception as e:
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': 'Connection Test Failed',
-                    'message': f'Error: {str(e)}',
-                    'type': 'danger',
-                    'sticky': True,
-                }
-            }
+            _logger.warning("Unexpected error in the mail connection probe", exc_info=True)
+            errors.append(f'Email: {_format_probe_error(e)}')
+        try:
+            connections, max_connections = db_future.result(timeout=1.0)
+        except (psycopg2.Error, FutureTimeoutError) as e:
+            errors.append(f'Database: {_format_probe_error(e)}')
+        except Exception as e:
+            _logger.warning("Unexpected error in the database connection probe", exc_info=True)
+            errors.append(f'Database: {_format_probe_error(e)}')
+        else:
+            # Connection exhaustion is the real failure mode a liveness query cannot see
+            if connections > POOL_SATURATION_WARNING * max_connections:
+                warning = f'{connections} of {max_connections} database connections are in use'
+        
+        with self._probe_cache_lock:
+            if errors or warning:
+                # Never serve a stale success after a failure
+                self._probe_cache.pop(cache_key, None)
+            else:
+                self._probe_cache[cache_key] = time.monotonic()
+        
+        if errors:
+            return _connection_test_notification(_CONNECTION_TEST_FAILURE, f"Error: {'; '.join(errors)}")
+        if warning:
+            return _connection_test_notification(_CONNECTION_TEST_WARNING, warning)
+        return _connection_test_notification(_CONNECTION_TEST_SUCCESS, 'All services are working properly')
 ```
 
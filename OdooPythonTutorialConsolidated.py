@@ -5,14 +5,28 @@
 ### Central School Management Model
 
 ```python
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import UserError, ValidationError
+from odoo.osv import expression
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import ast
+import json
 import logging
-import hashlib
+import secrets
 
 _logger = logging.getLogger(__name__)
 
+# Schools processed in parallel by execute_all_schools_operation, each on its own cursor
+SCHOOL_OPERATION_WORKERS = 4
+
+# Per-school operations that only need committed data and may commit independently,
+# so they are safe to run on worker cursors; anything else runs serially
+PARALLEL_SAFE_SCHOOL_OPERATIONS = {
+    '_auto_generate_daily_attendance',
+    '_auto_send_weekly_reports',
+}
+
 class ConsolidatedSchool(models.Model):
     _name = 'consolidated.school'
     _description = 'Consolidated School Management'
@@ -48,8 +62,7 @@ class ConsolidatedSchool(models.Model):
     
     # System Configuration
     is_active = fields.Boolean(string='Active', default=True)
-    database_name = fields.Char(string='Database Identifier', compute='_compute_database_name')
-    school_domain = fields.Char(string='School Domain', compute='_compute_school_domain')
+    database_name = fields.Char(string='Database Identifier', readonly=True)
     
     # Login Information
     admin_user_id = fields.Many2one('res.users', string='School Admin User')
@@ -60,6 +73,11 @@ class ConsolidatedSchool(models.Model):
     teacher_ids = fields.One2many('consolidated.teacher', 'school_id', string='Teachers')
     class_ids = fields.One2many('consolidated.class', 'school_id', string='Classes')
     
+    # Enforced by a unique index instead of a search per record on every write
+    _sql_constraints = [
+        ('school_code_unique', 'unique(code)', 'School code must be unique!'),
+    ]
+    
     # Computed fields
     @api.depends('name', 'code')
     def _compute_display_name(self):
@@ -68,18 +86,19 @@ class ConsolidatedSchool(models.Model):
     
     @api.depends('student_ids')
     def _compute_current_enrollment(self):
+        # Count active students per school in SQL instead of loading every student
+        groups = self.env['consolidated.student'].read_group(
+            [('school_id', 'in', self.ids), ('status', '=', 'active')],
+            ['school_id'], ['school_id']
+        )
+        counts = {group['school_id'][0]: group['school_id_count'] for group in groups}
         for school in self:
-            school.current_enrollment = len(school.student_ids.filtered(lambda s: s.status == 'active'))
-    
-    @api.depends('code')
-    def _compute_database_name(self):
-        for school in self:
-            school.database_name = f"school_{school.code.lower()}"
+            school.current_enrollment = counts.get(school.id, 0)
     
-    @api.depends('code')
-    def _compute_school_domain(self):
-        for school in self:
-            school.school_domain = f"[('school_id', '=', {school.id})]"
+    @property
+    def school_domain(self):
+        """Domain selecting the records that belong to these schools"""
+        return [('school_id', 'in', self.ids)]
     
     @api.depends('code')
     def _compute_login_url(self):
@@ -87,12 +106,31 @@ class ConsolidatedSchool(models.Model):
         for school in self:
             school.login_url = f"{base_url}/school/{school.code}"
     
-    # Constraints
-    @api.constrains('code')
-    def _check_school_code_unique(self):
-        for school in self:
-            if self.search([('code', '=', school.code), ('id', '!=', school.id)]):
-                raise ValidationError("School code must be unique!")
+    def init(self):
+        # Backfill schools created before database_name became a stored column
+        self.env.cr.execute("""
+            UPDATE consolidated_school
+               SET database_name = 'school_' || lower(code)
+             WHERE database_name IS NULL AND code IS NOT NULL
+        """)
+    
+    @api.model
+    def _database_name_from_code(self, code):
+        """Database identifier derived from a school code"""
+        return f"school_{code.lower()}" if code else False
+    
+    # database_name only changes with code, so set it alongside instead of recomputing
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            if 'code' in vals:
+                vals['database_name'] = self._database_name_from_code(vals['code'])
+        return super().create(vals_list)
+    
+    def write(self, vals):
+        if 'code' in vals:
+            vals = dict(vals, database_name=self._database_name_from_code(vals['code']))
+        return super().write(vals)
     
     # Sequence generation
     @api.model
@@ -102,31 +140,56 @@ class ConsolidatedSchool(models.Model):
     
     # Action methods
     def action_create_school_admin(self):
-        """Create school-specific admin user"""
-        for school in self:
-            if not school.admin_user_id:
-                # Create user group for this school
-                group_name = f"school_{school.code}_admin"
-                group = self.env['res.groups'].create({
-                    'name': f"{school.code} Administrator",
-                    'users': [(6, 0, [])]
-                })
-                
-                # Create admin user
-                user_vals = {
-                    'name': f"{school.name} Administrator",
-                    'login': f"admin_{school.code.lower()}",
-                    'password': self._generate_initial_password(school.code),
-                    'groups_id': [(4, group.id)],
-                    'school_id': school.id,
-                }
-                admin_user = self.env['res.users'].create(user_vals)
-                school.admin_user_id = admin_user.id
+        """Create school-specific admin user and show its initial credentials"""
+        credentials = self._create_school_admins()
+        if not credentials:
+            return False
+        # The password is only stored hashed, so this is the one chance to hand it over
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'School Admins Created',
+                'message': '; '.join(f"{code}: {login} / {password}" for code, (login, password) in credentials.items()),
+                'type': 'warning',
+                'sticky': True,
+            }
+        }
+    
+    def _create_school_admins(self):
+        """Create missing school admin users, return {school code: (login, initial password)}"""
+        schools = self.filtered(lambda school: not school.admin_user_id)
+        if not schools:
+            return {}
+        
+        passwords = [self._generate_initial_password(school.code) for school in schools]
+        
+        # Create one user group per school in a single batch
+        groups = self.env['res.groups'].create([{
+            'name': f"{school.code} Administrator",
+            'users': [(6, 0, [])]
+        } for school in schools])
+        
+        # Create all admin users in a single batch
+        admin_users = self.env['res.users'].create([{
+            'name': f"{school.name} Administrator",
+            'login': f"admin_{school.code.lower()}",
+            'password': password,
+            'groups_id': [(4, group.id)],
+            'school_id': school.id,
+        } for school, group, password in zip(schools, groups, passwords)])
+        
+        for school, admin_user in zip(schools, admin_users):
+            school.admin_user_id = admin_user
+        
+        return {
+            school.code: (admin_user.login, password)
+            for school, admin_user, password in zip(schools, admin_users, passwords)
+        }
     
     def _generate_initial_password(self, school_code):
-        """Generate initial password for school admin"""
-        base_string = f"{school_code}_{datetime.now().strftime('%Y%m%d')}"
-        return hashlib.md5(base_string.encode()).hexdigest()[:8]
+        """Generate a random initial password for a school user"""
+        return secrets.token_urlsafe(8)
     
     def action_generate_school_report(self):
         """Generate comprehensive school report"""
@@ -181,12 +244,19 @@ class ConsolidatedStudent(models.Model):
     
     @api.depends('school_id', 'school_roll_number')
     def _compute_student_id(self):
+        # Load every involved school code in one query before the loop
+        self.mapped('school_id.code')
         for student in self:
             if student.school_id and student.school_roll_number:
                 student.student_id = f"{student.school_id.code}-{student.school_roll_number:04d}"
             else:
                 student.student_id = "Pending"
     
+    def init(self):
+        # Serves every per-school lookup as well as the active-enrollment count
+        tools.create_index(self.env.cr, 'consolidated_student_school_status_idx',
+                           self._table, ['school_id', 'status'])
+    
     @api.model
     def _get_default_school(self):
         """Get default school from context or user"""
@@ -194,10 +264,7 @@ class ConsolidatedStudent(models.Model):
             return self.env.context.get('default_school_id')
         
         # Get school from current user
-        if hasattr(self.env.user, 'school_id') and self.env.user.school_id:
-            return self.env.user.school_id.id
-        
-        return False
+        return self.env.user.school_id.id or False
     
     @api.model
     def _generate_global_id(self):
@@ -207,13 +274,25 @@ class ConsolidatedStudent(models.Model):
     
     # Security rules implementation
     @api.model
-    def search(self, args, offset=0, limit=None, order=None, count=False):
-        """Override search to respect school boundaries"""
-        # Add school filter if user is school-specific
-        if hasattr(self.env.user, 'school_id') and self.env.user.school_id:
-            args = expression.AND([args, [('school_id', '=', self.env.user.school_id.id)]])
-        
-        return super().search(args, offset, limit, order, count)
+    def _restrict_to_user_school(self, domain):
+        """Domain limited to the current user's school, if they have one"""
+        school_id = self.env.user.school_id.id
+        if school_id:
+            domain = expression.AND([domain or [], [('school_id', '=', school_id)]])
+        return domain
+    
+    @api.model
+    def _search(self, domain, *args, **kwargs):
+        """Restrict searches to the user's school"""
+        # _search sits below search/search_count, so the school filter is merged
+        # into the one SQL query instead of wrapping search()
+        return super()._search(self._restrict_to_user_school(domain), *args, **kwargs)
+    
+    @api.model
+    def _read_group_raw(self, domain, *args, **kwargs):
+        """Restrict grouped reads to the user's school"""
+        # read_group builds its own query through _where_calc and never calls _search
+        return super()._read_group_raw(self._restrict_to_user_school(domain), *args, **kwargs)
 ```
 
 ## 2. Multi-School Security and Access Control
@@ -296,28 +375,66 @@ class ConsolidatedAutomatedTasks(models.Model):
     _description = 'Centralized Automated Tasks for All Schools'
     
     def execute_all_schools_operation(self, method_name, *args, **kwargs):
-        """Execute a method for all active schools"""
+        """Execute a method for all active schools
+        
+        Operations listed in PARALLEL_SAFE_SCHOOL_OPERATIONS run in worker threads, each
+        school on its own cursor that commits independently: workers cannot see this
+        transaction's uncommitted data, and their commits stay even if the caller rolls
+        back. Other operations, or calls made while this transaction has pending writes,
+        run serially in the caller's transaction.
+        """
         active_schools = self.env['consolidated.school'].search([('is_active', '=', True)])
         
+        if not hasattr(self, method_name):
+            return {school.code: f"Method {method_name} not found" for school in active_schools}
+        
+        if method_name not in PARALLEL_SAFE_SCHOOL_OPERATIONS or self._has_pending_writes():
+            return self._execute_schools_operation_serially(active_schools, method_name, args, kwargs)
+        
+        # Schools are independent, so run them in parallel, each in its own transaction
         results = {}
-        for school in active_schools:
+        with ThreadPoolExecutor(max_workers=SCHOOL_OPERATION_WORKERS) as executor:
+            futures = {
+                school.code: executor.submit(self._execute_school_operation, school.id, method_name, args, kwargs)
+                for school in active_schools
+            }
+            for code, future in futures.items():
+                try:
+                    results[code] = future.result()
+                except Exception as e:
+                    results[code] = f"Error: {str(e)}"
+                    _logger.error(f"Failed to execute {method_name} for school {code}: {str(e)}")
+        
+        return results
+    
+    def _has_pending_writes(self):
+        """Whether this transaction has written anything that is not committed yet"""
+        self.flush()
+        # PostgreSQL only assigns a transaction id once the transaction writes
+        self.env.cr.execute("SELECT txid_current_if_assigned()")
+        return self.env.cr.fetchone()[0] is not None
+    
+    def _execute_schools_operation_serially(self, schools, method_name, args, kwargs):
+        """Run the operation school by school in the caller's transaction"""
+        results = {}
+        for school in schools:
             try:
-                # Switch context to school
-                school_env = self.with_context(default_school_id=school.id)
-                
-                # Execute method
-                if hasattr(school_env, method_name):
-                    method = getattr(school_env, method_name)
+                with self.env.cr.savepoint():
+                    # Switch context to school
+                    method = getattr(self.with_context(default_school_id=school.id), method_name)
                     results[school.code] = method(*args, **kwargs)
-                else:
-                    results[school.code] = f"Method {method_name} not found"
-                    
             except Exception as e:
                 results[school.code] = f"Error: {str(e)}"
                 _logger.error(f"Failed to execute {method_name} for school {school.code}: {str(e)}")
-        
         return results
     
+    def _execute_school_operation(self, school_id, method_name, args, kwargs):
+        """Run one school's operation on a dedicated cursor (called from a worker thread)"""
+        with self.pool.cursor() as cr:
+            # Switch context to school
+            env = api.Environment(cr, self.env.uid, dict(self.env.context, default_school_id=school_id), su=self.env.su)
+            return getattr(env[self._name], method_name)(*args, **kwargs)
+    
     def auto_generate_daily_attendance_all_schools(self):
         """Generate daily attendance for all schools"""
         return self.execute_all_schools_operation('_auto_generate_daily_attendance')
@@ -336,22 +453,22 @@ class ConsolidatedAutomatedTasks(models.Model):
             ('status', '=', 'active')
         ])
         
-        generated_count = 0
-        for student in students:
-            existing = Attendance.search([
-                ('student_id', '=', student.id),
-                ('date', '=', today)
-            ])
-            
-            if not existing:
-                Attendance.create({
-                    'student_id': student.id,
-                    'school_id': school_id,
-                    'date': today,
-                    'status': 'absent',
-                    'class_id': student.class_id.id,
-                })
-                generated_count += 1
+        # One query for the students that already have a row today
+        existing_student_ids = set(Attendance.search([
+            ('student_id', 'in', students.ids),
+            ('date', '=', today)
+        ]).mapped('student_id').ids)
+        
+        # Then one batched create for everyone else
+        vals_list = [{
+            'student_id': student.id,
+            'school_id': school_id,
+            'date': today,
+            'status': 'absent',
+            'class_id': student.class_id.id,
+        } for student in students if student.id not in existing_student_ids]
+        Attendance.create(vals_list)
+        generated_count = len(vals_list)
         
         return f"Generated {generated_count} attendance records"
     
@@ -387,8 +504,20 @@ class ConsolidatedAutomatedTasks(models.Model):
         
         active_schools = self.env['consolidated.school'].search([('is_active', '=', True)])
         
+        # Per-school counts for every school in one grouped query each
+        counts = {
+            'teachers': self._count_by_school('consolidated.teacher', active_schools),
+            'classes': self._count_by_school('consolidated.class', active_schools),
+            'attendance_today': self._count_by_school('consolidated.attendance', active_schools, [
+                ('date', '=', fields.Date.today()),
+                ('status', '=', 'present')
+            ]),
+        }
+        
         for school in active_schools:
-            school_data = self._collect_school_data(school)
+            school_data = self._collect_school_data(school, {
+                key: school_counts.get(school.id, 0) for key, school_counts in counts.items()
+            })
             central_data['schools'][school.code] = school_data
         
         # Store in central reporting model
@@ -399,20 +528,24 @@ class ConsolidatedAutomatedTasks(models.Model):
         
         return f"Synced data for {len(active_schools)} schools"
     
-    def _collect_school_data(self, school):
+    def _count_by_school(self, model_name, schools, domain=None):
+        """Return {school_id: record count} for `model_name`, counted in SQL"""
+        rows = self.env[model_name].read_group(
+            [('school_id', 'in', schools.ids)] + (domain or []),
+            ['school_id'], ['school_id']
+        )
+        return {row['school_id'][0]: row['school_id_count'] for row in rows}
+    
+    def _collect_school_data(self, school, counts):
         """Collect data for a specific school"""
         return {
             'school_info': {
                 'name': school.name,
                 'enrollment': school.current_enrollment,
-                'teachers': len(school.teacher_ids),
-                'classes': len(school.class_ids),
+                'teachers': counts['teachers'],
+                'classes': counts['classes'],
             },
-            'attendance_today': self.env['consolidated.attendance'].search_count([
-                ('school_id', '=', school.id),
-                ('date', '=', fields.Date.today()),
-                ('status', '=', 'present')
-            ]),
+            'attendance_today': counts['attendance_today'],
             'financial_status': self._get_school_financial_status(school),
         }
 ```
@@ -428,33 +561,35 @@ def create_school_users(records):
     Server action to create user accounts for multiple schools
     """
     try:
-        created_users = []
+        # Create missing admin users in one batch and keep their initial credentials
+        admin_credentials = records._create_school_admins()
+        created_users = [f"Admin for {code}" for code in admin_credentials]
+        credentials = [(f"{code} admin", login, password) for code, (login, password) in admin_credentials.items()]
         
         for school in records:
-            # Create admin user if not exists
-            if not school.admin_user_id:
-                school.action_create_school_admin()
-                created_users.append(f"Admin for {school.code}")
-            
             # Create principal user
             if school.principal_email:
+                password = school._generate_initial_password(school.code)
                 principal_user = env['res.users'].create({
                     'name': school.principal_name or f"Principal {school.name}",
                     'login': school.principal_email,
                     'email': school.principal_email,
                     'school_id': school.id,
                     'school_role': 'principal',
-                    'password': f"principal_{school.code}123",
+                    'password': password,
                     'groups_id': [(6, 0, [env.ref('consolidated_smis.group_school_principal').id])]
                 })
                 created_users.append(f"Principal for {school.code}")
+                credentials.append((f"{school.code} principal", principal_user.login, password))
         
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
             'params': {
                 'title': 'Users Created',
-                'message': f'Created users for {len(created_users)} schools',
+                'message': f'Created users for {len(created_users)} schools' + ''.join(
+                    f'; {label}: {login} / {password}' for label, login, password in credentials
+                ),
                 'type': 'success',
                 'sticky': True,
             }
@@ -552,8 +687,43 @@ class ConsolidatedCentralReport(models.Model):
             'school_performance': []
         }
         
+        # Load the active students of every school once instead of one search per school
+        all_students = self.env['consolidated.student'].search([
+            ('school_id', 'in', schools.ids),
+            ('status', '=', 'active')
+        ])
+        student_ids_by_school = {}
+        school_of_student = {}
+        for student in all_students:
+            student_ids_by_school.setdefault(student.school_id.id, []).append(student.id)
+            school_of_student[student.id] = student.school_id.id
+        
+        # Grade totals and attendance histograms of every school in two queries,
+        # grouped per student and folded into their school
+        grade_totals = {}
+        for row in self.env['consolidated.grade'].read_group([
+            ('student_id', 'in', all_students.ids)
+        ], ['percentage:sum'], ['student_id']):
+            totals = grade_totals.setdefault(school_of_student[row['student_id'][0]], [0.0, 0])
+            totals[0] += row['percentage'] or 0
+            totals[1] += row['student_id_count']
+        
+        status_counts = {}
+        for row in self.env['consolidated.attendance'].read_group([
+            ('student_id', 'in', all_students.ids),
+            ('date', '>=', self.date_from),
+            ('date', '<=', self.date_to)
+        ], ['status'], ['student_id', 'status'], lazy=False):
+            counts = status_counts.setdefault(school_of_student[row['student_id'][0]], {})
+            counts[row['status']] = counts.get(row['status'], 0) + row['__count']
+        
         for school in schools:
-            performance = self._calculate_school_performance(school)
+            students = all_students.browse(student_ids_by_school.get(school.id, []))
+            performance = self._calculate_school_performance(
+                school, students,
+                grade_totals=grade_totals.get(school.id, [0.0, 0]),
+                status_counts=status_counts.get(school.id, {}),
+            )
             report_data['school_performance'].append({
                 'school_code': school.code,
                 'school_name': school.name,
@@ -566,37 +736,45 @@ class ConsolidatedCentralReport(models.Model):
             'report_type': 'academic',
             'date_from': self.date_from,
             'date_to': self.date_to,
-            'report_data': str(report_data)
+            'report_data': json.dumps(report_data, default=str)
         })
         
         return report_data
     
-    def _calculate_school_performance(self, school):
-        """Calculate performance metrics for a school"""
-        students = self.env['consolidated.student'].search([
-            ('school_id', '=', school.id),
-            ('status', '=', 'active')
-        ])
+    def _calculate_school_performance(self, school, students=None, grade_totals=None, status_counts=None):
+        """Calculate performance metrics for a school
+        
+        grade_totals ([percentage sum, grade count]) and status_counts ({status: count})
+        are queried for this school alone unless the caller aggregated them already.
+        """
+        if students is None:
+            students = self.env['consolidated.student'].search([
+                ('school_id', '=', school.id),
+                ('status', '=', 'active')
+            ])
         
         if not students:
             return {}
         
-        # Calculate average grades
-        grades = self.env['consolidated.grade'].search([
-            ('student_id', 'in', students.ids)
-        ])
-        
-        avg_percentage = sum(grades.mapped('percentage')) / len(grades) if grades else 0
+        # Calculate average grades (AVG in SQL, no grade records loaded)
+        if grade_totals is None:
+            grade_rows = self.env['consolidated.grade'].read_group([
+                ('student_id', 'in', students.ids)
+            ], ['percentage:avg'], [])
+            avg_percentage = (grade_rows[0]['percentage'] or 0) if grade_rows else 0
+        else:
+            avg_percentage = grade_totals[0] / grade_totals[1] if grade_totals[1] else 0
         
-        # Calculate attendance rate
-        attendances = self.env['consolidated.attendance'].search([
-            ('student_id', 'in', students.ids),
-            ('date', '>=', self.date_from),
-            ('date', '<=', self.date_to)
-        ])
+        # Calculate attendance rate from a per-status count histogram
+        if status_counts is None:
+            status_counts = {row['status']: row['status_count'] for row in self.env['consolidated.attendance'].read_group([
+                ('student_id', 'in', students.ids),
+                ('date', '>=', self.date_from),
+                ('date', '<=', self.date_to)
+            ], ['status'], ['status'])}
         
-        present_count = len(attendances.filtered(lambda a: a.status == 'present'))
-        attendance_rate = (present_count / len(attendances)) * 100 if attendances else 0
+        total_attendances = sum(status_counts.values())
+        attendance_rate = (status_counts.get('present', 0) / total_attendances) * 100 if total_attendances else 0
         
         return {
             'total_students': len(students),
@@ -609,6 +787,13 @@ class ConsolidatedCentralReport(models.Model):
 ## 6. School-Specific Configuration Management
 
 ```python
+def load_stored_json(value):
+    """Load a JSON text field, accepting rows written as Python literals for eval()"""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return ast.literal_eval(value)
+
 class ConsolidatedSchoolConfig(models.Model):
     _name = 'consolidated.school.config'
     _description = 'School-Specific Configuration'
@@ -625,6 +810,14 @@ class ConsolidatedSchoolConfig(models.Model):
     
     is_active = fields.Boolean(string='Active', default=True)
     
+    @api.constrains('config_value', 'config_type')
+    def _check_json_config_value(self):
+        for config in self.filtered(lambda c: c.config_type == 'json' and c.config_value):
+            try:
+                json.loads(config.config_value)
+            except ValueError:
+                raise ValidationError(f"Configuration {config.config_key} is not valid JSON")
+    
     @api.model
     def get_school_config(self, school_id, key, default=None):
         """Get school-specific configuration value"""
@@ -645,7 +838,7 @@ class ConsolidatedSchoolConfig(models.Model):
         elif config_type == 'boolean':
             return value.lower() == 'true' if value else False
         elif config_type == 'json':
-            return eval(value) if value else {}
+            return load_stored_json(value) if value else {}
         else:
             return value
 
@@ -662,10 +855,18 @@ class ConsolidatedSchoolTemplate(models.Model):
     
     configuration_data = fields.Text(string='Configuration Data')  # JSON data
     
+    @api.constrains('configuration_data')
+    def _check_configuration_data(self):
+        for template in self.filtered('configuration_data'):
+            try:
+                json.loads(template.configuration_data)
+            except ValueError:
+                raise ValidationError(f"Template {template.name} configuration is not valid JSON")
+    
     def apply_template_to_school(self, school_id):
         """Apply template configuration to a school"""
         school = self.env['consolidated.school'].browse(school_id)
-        config_data = eval(self.configuration_data) if self.configuration_data else {}
+        config_data = load_stored_json(self.configuration_data) if self.configuration_data else {}
         
         # Apply template-specific configurations
         if self.template_type == 'academic':
@@ -690,35 +891,58 @@ class ConsolidatedBulkOperations(models.Model):
             'failed': []
         }
         
+        # Resolve every school code in one query
+        school_codes = {student_data.get('school_code') for student_data in student_data_list}
+        schools_by_code = {
+            school.code: school.id
+            for school in self.env['consolidated.school'].search([('code', 'in', list(school_codes))])
+        }
+        
+        rows = []
         for student_data in student_data_list:
-            try:
-                school_code = student_data.get('school_code')
-                school = self.env['consolidated.school'].search([('code', '=', school_code)], limit=1)
-                
-                if not school:
-                    results['failed'].append({
-                        'data': student_data,
-                        'error': f"School {school_code} not found"
-                    })
-                    continue
-                
-                # Create student with school context
-                student_vals = {
-                    'school_id': school.id,
-                    'first_name': student_data['first_name'],
-                    'last_name': student_data['last_name'],
-                    'school_roll_number': student_data.get('roll_number'),
-                    'class_id': student_data.get('class_id'),
-                }
-                
-                student = self.env['consolidated.student'].create(student_vals)
-                results['successful'].append(student.display_name)
-                
-            except Exception as e:
+            school_code = student_data.get('school_code')
+            school_id = schools_by_code.get(school_code)
+            if not school_id:
                 results['failed'].append({
                     'data': student_data,
-                    'error': str(e)
+                    'error': f"School {school_code} not found"
                 })
+                continue
+            
+            missing = [key for key in ('first_name', 'last_name') if key not in student_data]
+            if missing:
+                results['failed'].append({
+                    'data': student_data,
+                    'error': f"Missing required field(s): {', '.join(missing)}"
+                })
+                continue
+            
+            rows.append((student_data, {
+                'school_id': school_id,
+                'first_name': student_data['first_name'],
+                'last_name': student_data['last_name'],
+                'school_roll_number': student_data.get('roll_number'),
+                'class_id': student_data.get('class_id'),
+            }))
+        
+        Student = self.env['consolidated.student']
+        try:
+            # Fast path: create all students in one batch
+            with self.env.cr.savepoint():
+                students = Student.create([student_vals for student_data, student_vals in rows])
+            results['successful'].extend(students.mapped('display_name'))
+        except Exception:
+            # Fall back to one create per row to report which ones failed
+            for student_data, student_vals in rows:
+                try:
+                    with self.env.cr.savepoint():
+                        student = Student.create(student_vals)
+                    results['successful'].append(student.display_name)
+                except Exception as e:
+                    results['failed'].append({
+                        'data': student_data,
+                        'error': str(e)
+                    })
         
         return results
     
@@ -726,22 +950,18 @@ class ConsolidatedBulkOperations(models.Model):
         """Bulk update academic year for all schools"""
         schools = self.env['consolidated.school'].search([('is_active', '=', True)])
         
-        updated_count = 0
-        for school in schools:
-            try:
-                # Update school academic year
-                school.write({'academic_year_id': new_academic_year_id})
-                
-                # Update all students in school
-                students = self.env['consolidated.student'].search([
-                    ('school_id', '=', school.id)
-                ])
-                students.write({'academic_year_id': new_academic_year_id})
-                
-                updated_count += 1
-                
-            except Exception as e:
-                _logger.error(f"Failed to update academic year for school {school.code}: {str(e)}")
+        try:
+            # One UPDATE for the schools and one for all their students
+            with self.env.cr.savepoint():
+                schools.write({'academic_year_id': new_academic_year_id})
+                self.env['consolidated.student'].search([
+                    ('school_id', 'in', schools.ids)
+                ]).write({'academic_year_id': new_academic_year_id})
+            updated_count = len(schools)
+            
+        except Exception as e:
+            updated_count = 0
+            _logger.error(f"Failed to update academic year for schools {', '.join(schools.mapped('code'))}: {str(e)}")
         
         return updated_count
 ```
@@ -753,23 +973,38 @@ class ConsolidatedPerformance(models.Model):
     _name = 'consolidated.performance'
     _description = 'Performance Optimization Utilities'
     
+    def init(self):
+        # Attendance, grade and teacher are defined outside this file, so their indexes
+        # are maintained here instead of in their own init()
+        self.optimize_school_queries()
+    
     def optimize_school_queries(self):
         """Optimize database queries for multi-school environment"""
         optimizations = {}
         
-        # Create indexes for frequently searched fields
         index_queries = [
-            "CREATE INDEX IF NOT EXISTS consolidated_student_school_id_idx ON consolidated_student (school_id)",
+            # Superseded by the composite and covering indexes below
+            "DROP INDEX IF EXISTS consolidated_student_school_id_idx",
+            "DROP INDEX IF EXISTS consolidated_attendance_date_idx",
+            "DROP INDEX IF EXISTS consolidated_grade_student_id_idx",
+            # Create indexes matching the WHERE clauses of the hot queries
             "CREATE INDEX IF NOT EXISTS consolidated_teacher_school_id_idx ON consolidated_teacher (school_id)",
-            "CREATE INDEX IF NOT EXISTS consolidated_attendance_date_idx ON consolidated_attendance (date)",
-            "CREATE INDEX IF NOT EXISTS consolidated_grade_student_id_idx ON consolidated_grade (student_id)",
+            # Present count of a school for a day (central sync)
+            "CREATE INDEX IF NOT EXISTS consolidated_attendance_school_date_status_idx ON consolidated_attendance (school_id, date, status)",
+            # Existing rows per student and date range (attendance generation, performance)
+            "CREATE INDEX IF NOT EXISTS consolidated_attendance_student_date_idx ON consolidated_attendance (student_id, date)",
+            # Covering index so the grade average is an index-only scan
+            "CREATE INDEX IF NOT EXISTS consolidated_grade_student_idx ON consolidated_grade (student_id) INCLUDE (percentage)",
         ]
         
         for query in index_queries:
+            # One savepoint per statement so a failure does not abort the ones after it
             try:
-                self.env.cr.execute(query)
+                with self.env.cr.savepoint():
+                    self.env.cr.execute(query)
                 optimizations[query] = "Success"
             except Exception as e:
+                _logger.warning("Index maintenance failed: %s (%s)", query, e)
                 optimizations[query] = f"Failed: {str(e)}"
         
         return optimizations